@@ -13,14 +13,192 @@ Configuration Priority (highest to lowest):
 """
 
 import os
+import re
+import logging
+import copy
+import hashlib
+import json
+import pickle
 import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
+
+_log = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Hardcoded defaults (lowest configuration priority); never mutate, deep-copy instead
+_DEFAULTS: Dict[str, Any] = {
+    "timestamp": {
+        "input_formats": [
+            {
+                "pattern": r'\[(\d{2}):(\d{2}):(\d{2})\]',
+                "name": "bracketed_hms",
+                "groups": ["hours", "minutes", "seconds"],
+                "enabled": True
+            },
+            {
+                "pattern": r'(\d{2}):(\d{2}):(\d{2})',
+                "name": "simple_hms", 
+                "groups": ["hours", "minutes", "seconds"],
+                "enabled": True
+            },
+            {
+                "pattern": r'\[(\d{1,2}):(\d{2}):(\d{2})\]',
+                "name": "bracketed_hms_flex",
+                "groups": ["hours", "minutes", "seconds"],
+                "enabled": False
+            }
+        ],
+        "output_format": "[{hours:02d}:{minutes:02d}:{seconds:02d}]",
+        "default_format": "bracketed_hms"
+    },
+    "files": {
+        "input_dir": "inputs",
+        "output_dir": "outputs", 
+        "encoding": "utf-8",
+        "create_backup": False
+    },
+    "output_naming": {
+        "template": "{basename}_{sign}{adjustment}s{extension}",
+        "positive_sign": "plus",
+        "negative_sign": "minus"
+    },
+    "processing": {
+        "negative_handling": "zero",
+        "preserve_formatting": True
+    }
+}
+
+# Unpickling a fresh copy is several times faster than copy.deepcopy for this plain-data tree
+_DEFAULTS_PICKLE = pickle.dumps(_DEFAULTS, protocol=pickle.HIGHEST_PROTOCOL)
+
+# Environment variables that override config values
+_ENV_VARS = frozenset({"TIMESTAMP_FORMAT", "TIMESTAMP_INPUT_DIR", "TIMESTAMP_OUTPUT_DIR", "TIMESTAMP_ENCODING"})
+
+# Home-directory user config candidates, resolved once per process
+try:
+    _HOME = Path.home()
+    _HOME_CANDIDATES: Tuple[Path, ...] = (
+        _HOME / ".config" / "timestamp-adjuster" / "config.yaml",  # User config dir
+        _HOME / ".timestamp-adjuster.yaml",  # User home dir
+    )
+except RuntimeError:  # No resolvable home directory
+    _HOME = None
+    _HOME_CANDIDATES = ()
+
+# Marks a dot-path that was looked up but not found in the config
+_NOT_FOUND = object()
+
+# Use orjson for the JSON parse cache when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Directory for JSON copies of parsed YAML files (None disables them)
+_xdg_cache = os.environ.get("XDG_CACHE_HOME")
+if _xdg_cache:
+    _SIDECAR_DIR: Optional[Path] = Path(_xdg_cache) / "timestamp-adjuster"
+elif _HOME is not None:
+    _SIDECAR_DIR = _HOME / ".cache" / "timestamp-adjuster"
+else:
+    _SIDECAR_DIR = None
+
+# Parsed YAML files keyed by resolved path: (mtime_ns, size, data)
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+
+def _load_yaml_file(path: Path, key: str, st: os.stat_result) -> Dict[str, Any]:
+    """
+    Parse a YAML file, going through its JSON copy in the cache directory when that is current.
+    
+    Args:
+        path: Path to the YAML file
+        key: Resolved path of the YAML file
+        st: Stat result of the YAML file
+        
+    Returns:
+        Dict[str, Any]: Parsed data
+    """
+    sidecar_path = None
+    if _SIDECAR_DIR is not None:
+        sidecar_path = _SIDECAR_DIR / (hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+        try:
+            cached = _json_loads(sidecar_path.read_bytes())
+            # Only trust a copy of exactly this version of the file; a restored
+            # older file (git checkout, cp -p, ...) must not pick up a newer copy
+            if (cached.get("path") == key and cached.get("mtime_ns") == st.st_mtime_ns
+                    and cached.get("size") == st.st_size):
+                return cached["data"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass  # Missing, stale or unreadable copy - fall back to YAML
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=_SafeLoader) or {}
+    
+    # Only write the copy when JSON round-trips the data exactly (no dates, int keys, ...)
+    if sidecar_path is not None:
+        try:
+            serialized = _json_dumps(data)
+            if _json_loads(serialized) == data:
+                _SIDECAR_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_path = sidecar_path.with_name(f"{sidecar_path.name}.{os.getpid()}.tmp")
+                tmp_path.write_bytes(_json_dumps({
+                    "path": key, "mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data,
+                }))
+                os.replace(tmp_path, sidecar_path)
+        except (OSError, TypeError, ValueError):
+            pass  # Best effort only, e.g. read-only cache directory
+    
+    return data
+
+
+def _load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """
+    Load a YAML file, reusing the previous parse if the file is unchanged.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Dict[str, Any]: Parsed data (a private copy the caller may mutate)
+    """
+    st = path.stat()
+    key = str(path.resolve())
+    entry = _YAML_CACHE.get(key)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(entry[2])
+    
+    data = _load_yaml_file(path, key, st)
+    
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _YAML_CACHE.move_to_end(key)
+    while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
 
 
 class Config:
     """Configuration manager for timestamp adjuster."""
     
+    # Defaults merged with the base config, shared by all instances:
+    # resolved base path -> (mtime_ns, pickled merged tree)
+    _base_cache: Dict[str, Tuple[int, bytes]] = {}
+    
     def __init__(self, config_file: Optional[str] = None, ignore_user_config: bool = False, test_mode: bool = False):
         """
         Initialize configuration.
@@ -30,79 +208,178 @@ class Config:
             ignore_user_config: If True, skips loading user configuration (useful for tests)
             test_mode: If True, only loads the specified config file and defaults (for isolated testing)
         """
-        self.config_data = {}
+        self._config_data: Dict[str, Any] = {}
+        self._config_file = config_file
+        self._loaded = False
+        self._cwd_files = None
+        self._all_formats: Optional[Tuple[Mapping[str, Any], ...]] = None
+        self._enabled_formats: Optional[Tuple[Mapping[str, Any], ...]] = None
+        self._get_cache: Dict[str, Any] = {}
+        self._data_exposed = False  # True once config_data was handed out (see _ensure_current)
         self.ignore_user_config = ignore_user_config
         self.test_mode = test_mode
-        self.load_config(config_file)
+        # Files are read lazily on first access, see _ensure_loaded()
+    
+    @property
+    def config_data(self) -> Dict[str, Any]:
+        """
+        Merged configuration tree (loaded on first access).
+        
+        Callers may edit the returned tree in place. From then on lookups are
+        no longer cached, so edits show up in get() and the accessors; use
+        set() to keep them cached.
+        """
+        self._ensure_loaded()
+        self._data_exposed = True
+        return self._config_data
+    
+    @config_data.setter
+    def config_data(self, value: Dict[str, Any]):
+        self._config_data = value
+        self._loaded = True
+        self._data_exposed = True  # The caller keeps a reference to the tree
+        self._refresh_derived()
+    
+    def _ensure_loaded(self):
+        """Load the configuration if it has not been loaded yet."""
+        if not self._loaded:
+            self.load_config(self._config_file)
+    
+    def _ensure_current(self):
+        """Load the configuration, recomputing derived values if config_data may have been edited."""
+        self._ensure_loaded()
+        if self._data_exposed:
+            self._refresh_derived()
     
     def load_config(self, config_file: Optional[str] = None):
         """
         Load configuration from base config, user config, environment variables, and defaults.
         Priority: Environment vars > User config > Legacy config > Base config > Hardcoded defaults
         """
-        # Start with hardcoded defaults
-        self.config_data = self._get_defaults()
+        self._config_file = config_file
+        self._loaded = True
+        self._data_exposed = False
         
         # In test mode, only load the specified config file
         if self.test_mode:
-            if config_file and Path(config_file).exists():
-                try:
-                    with open(config_file, 'r', encoding='utf-8') as f:
-                        test_config = yaml.safe_load(f) or {}
-                    self._merge_config(self.config_data, test_config)
-                    print(f"Loaded test configuration from: {config_file}")
-                except Exception as e:
-                    print(f"Warning: Could not load test config file {config_file}: {e}")
+            self._config_data = self._get_defaults()
+            if config_file:
+                self._try_load_and_merge(Path(config_file), "test")
+            self._refresh_derived()
             return
         
         # Load base configuration (application defaults)
-        base_config_path = self._find_base_config()
-        if base_config_path and base_config_path.exists():
-            try:
-                with open(base_config_path, 'r', encoding='utf-8') as f:
-                    base_config = yaml.safe_load(f) or {}
-                self._merge_config(self.config_data, base_config)
-                print(f"Loaded base configuration from: {base_config_path}")
-            except Exception as e:
-                print(f"Warning: Could not load base config file {base_config_path}: {e}")
+        self._load_base_layer(self._find_base_config())
         
         # Load legacy config for backward compatibility (lower priority than user config)
-        legacy_config_path = self._find_legacy_config()
-        if legacy_config_path and legacy_config_path.exists():
-            try:
-                with open(legacy_config_path, 'r', encoding='utf-8') as f:
-                    legacy_config = yaml.safe_load(f) or {}
-                self._merge_config(self.config_data, legacy_config)
-                print(f"Loaded legacy configuration from: {legacy_config_path}")
-                print("Warning: Legacy config files are deprecated. Consider migrating to config.user.yaml")
-            except Exception as e:
-                print(f"Warning: Could not load legacy config file {legacy_config_path}: {e}")
+        if self._try_load_and_merge(self._find_legacy_config(), "legacy"):
+            _log.warning("Legacy config files are deprecated. Consider migrating to config.user.yaml")
         
         # Load user configuration (overrides legacy config) - skip if ignore_user_config is True
         if not self.ignore_user_config:
-            user_config_path = self._find_user_config(config_file)
-            if user_config_path and user_config_path.exists():
-                try:
-                    with open(user_config_path, 'r', encoding='utf-8') as f:
-                        user_config = yaml.safe_load(f) or {}
-                    self._merge_config(self.config_data, user_config)
-                    print(f"Loaded user configuration from: {user_config_path}")
-                except Exception as e:
-                    print(f"Warning: Could not load user config file {user_config_path}: {e}")
+            self._try_load_and_merge(self._find_user_config(config_file), "user")
         
         # Override with environment variables
         self._load_env_vars()
+        self._refresh_derived()
+    
+    def _load_base_layer(self, path: Optional[Path]):
+        """Reset config_data to the defaults merged with the base config, reusing an earlier merge."""
+        key = None
+        mtime_ns = None
+        if path:
+            try:
+                key = str(path.resolve())
+                mtime_ns = path.stat().st_mtime_ns
+            except OSError:
+                key = None
+        
+        cached = Config._base_cache.get(key) if key else None
+        if cached and cached[0] == mtime_ns:
+            self._config_data = pickle.loads(cached[1])
+            _log.info("Loaded base configuration from: %s", path)
+            return
+        
+        self._config_data = self._get_defaults()
+        if key and self._try_load_and_merge(path, "base"):
+            Config._base_cache[key] = (mtime_ns, pickle.dumps(self._config_data, protocol=pickle.HIGHEST_PROTOCOL))
+    
+    def _try_load_and_merge(self, path: Optional[Path], label: str) -> bool:
+        """
+        Load a YAML config file and merge it over the current configuration.
+        
+        Args:
+            path: Config file path, or None if no candidate was found
+            label: Config layer name used in diagnostics ("base", "user", ...)
+            
+        Returns:
+            bool: True if the file was loaded and merged
+        """
+        if not path:
+            return False
+        try:
+            data = _load_yaml_cached(path)
+            self._merge_config(self._config_data, data)
+            _log.info("Loaded %s configuration from: %s", label, path)
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            _log.warning("Could not load %s config file %s: %s", label, path, e)
+            return False
+    
+    def _refresh_derived(self):
+        """Recompute lookup caches and accessor values after config_data changes."""
+        self._get_cache.clear()
+        self._all_formats = None
+        self._enabled_formats = None
+        
+        self.output_format = self.get("timestamp.output_format", _DEFAULTS["timestamp"]["output_format"])
+        self.input_dir = self.get("files.input_dir", _DEFAULTS["files"]["input_dir"])
+        self.output_dir = self.get("files.output_dir", _DEFAULTS["files"]["output_dir"])
+        self.encoding = self.get("files.encoding", _DEFAULTS["files"]["encoding"])
+        self.output_template = self.get("output_naming.template", _DEFAULTS["output_naming"]["template"])
+        self.positive_sign = self.get("output_naming.positive_sign", _DEFAULTS["output_naming"]["positive_sign"])
+        self.negative_sign = self.get("output_naming.negative_sign", _DEFAULTS["output_naming"]["negative_sign"])
+    
+    def _prepare_formats(self):
+        """Validate timestamp input patterns once and cache read-only views of all/enabled formats."""
+        self._ensure_loaded()
+        all_formats = []
+        enabled_formats = []
+        for fmt in self.get("timestamp.input_formats", []):
+            fmt = dict(fmt)
+            if isinstance(fmt.get("groups"), list):
+                fmt["groups"] = tuple(fmt["groups"])
+            try:
+                re.compile(fmt["pattern"])
+            except (KeyError, TypeError, re.error) as e:
+                _log.warning("Skipping invalid timestamp format %s: %s", fmt.get('name', '<unnamed>'), e)
+                all_formats.append(MappingProxyType(fmt))
+                continue
+            view = MappingProxyType(fmt)
+            all_formats.append(view)
+            if fmt.get("enabled", True):
+                enabled_formats.append(view)
+        self._all_formats = tuple(all_formats)
+        self._enabled_formats = tuple(enabled_formats)
+    
+    def _scan_cwd(self) -> set:
+        """List regular files in the current directory once, so config lookups need no per-candidate stat()."""
+        if self._cwd_files is None:
+            try:
+                with os.scandir('.') as entries:
+                    self._cwd_files = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                self._cwd_files = set()
+        return self._cwd_files
     
     def _find_base_config(self) -> Optional[Path]:
         """Find base configuration file."""
-        possible_locations = [
-            Path("config.base.yaml"),  # Current directory
-            Path("config.base.yml"),   # Alternative extension
-        ]
-        
-        for location in possible_locations:
-            if location.exists():
-                return location
+        cwd_files = self._scan_cwd()
+        for name in ("config.base.yaml", "config.base.yml"):
+            if name in cwd_files:
+                return Path(name)
         
         return None
     
@@ -112,14 +389,12 @@ class Config:
             return Path(config_file)
         
         # Check in order of preference
-        possible_locations = [
-            Path("config.user.yaml"),  # Current directory
-            Path("config.user.yml"),   # Alternative extension
-            Path.home() / ".config" / "timestamp-adjuster" / "config.yaml",  # User config dir
-            Path.home() / ".timestamp-adjuster.yaml",  # User home dir
-        ]
+        cwd_files = self._scan_cwd()
+        for name in ("config.user.yaml", "config.user.yml"):
+            if name in cwd_files:
+                return Path(name)
         
-        for location in possible_locations:
+        for location in _HOME_CANDIDATES:
             if location.exists():
                 return location
         
@@ -127,91 +402,57 @@ class Config:
     
     def _find_legacy_config(self) -> Optional[Path]:
         """Find legacy configuration files for backward compatibility."""
-        possible_locations = [
-            Path("config.yaml"),  # Current directory
-            Path("config.yml"),   # Alternative extension
-            Path("timestamp-adjuster.yaml"),  # Current directory alternative
-        ]
-        
-        for location in possible_locations:
-            if location.exists():
-                return location
+        cwd_files = self._scan_cwd()
+        for name in ("config.yaml", "config.yml", "timestamp-adjuster.yaml"):
+            if name in cwd_files:
+                return Path(name)
         
         return None
 
     def _get_defaults(self) -> Dict[str, Any]:
-        """Get default configuration values."""
-        return {
-            "timestamp": {
-                "input_formats": [
-                    {
-                        "pattern": r'\[(\d{2}):(\d{2}):(\d{2})\]',
-                        "name": "bracketed_hms",
-                        "groups": ["hours", "minutes", "seconds"],
-                        "enabled": True
-                    },
-                    {
-                        "pattern": r'(\d{2}):(\d{2}):(\d{2})',
-                        "name": "simple_hms", 
-                        "groups": ["hours", "minutes", "seconds"],
-                        "enabled": True
-                    },
-                    {
-                        "pattern": r'\[(\d{1,2}):(\d{2}):(\d{2})\]',
-                        "name": "bracketed_hms_flex",
-                        "groups": ["hours", "minutes", "seconds"],
-                        "enabled": False
-                    }
-                ],
-                "output_format": "[{hours:02d}:{minutes:02d}:{seconds:02d}]",
-                "default_format": "bracketed_hms"
-            },
-            "files": {
-                "input_dir": "inputs",
-                "output_dir": "outputs", 
-                "encoding": "utf-8",
-                "create_backup": False
-            },
-            "output_naming": {
-                "template": "{basename}_{sign}{adjustment}s{extension}",
-                "positive_sign": "plus",
-                "negative_sign": "minus"
-            },
-            "processing": {
-                "negative_handling": "zero",
-                "preserve_formatting": True
-            }
-        }
+        """Get a fresh, mutable copy of the default configuration values."""
+        return pickle.loads(_DEFAULTS_PICKLE)
     
     def _merge_config(self, base: Dict, override: Dict):
-        """Recursively merge configuration dictionaries."""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._merge_config(base[key], value)
-            else:
-                base[key] = value
+        """Deep-merge configuration dictionaries (iteratively, one nesting level per stack entry)."""
+        stack = [(base, override)]
+        while stack:
+            base_dict, override_dict = stack.pop()
+            for key, value in override_dict.items():
+                base_value = base_dict.get(key)
+                if isinstance(base_value, dict) and isinstance(value, dict):
+                    stack.append((base_value, value))
+                else:
+                    base_dict[key] = value
     
     def _load_env_vars(self):
         """Load configuration from environment variables."""
+        present = _ENV_VARS & os.environ.keys()
+        if not present:
+            return
+        
         # Timestamp format override
-        if env_format := os.getenv("TIMESTAMP_FORMAT"):
-            self.config_data["timestamp"]["output_format"] = env_format
+        if "TIMESTAMP_FORMAT" in present and (env_format := os.environ["TIMESTAMP_FORMAT"]):
+            self._config_data["timestamp"]["output_format"] = env_format
         
         # Input/output directories
-        if env_input_dir := os.getenv("TIMESTAMP_INPUT_DIR"):
-            self.config_data["files"]["input_dir"] = env_input_dir
+        if "TIMESTAMP_INPUT_DIR" in present and (env_input_dir := os.environ["TIMESTAMP_INPUT_DIR"]):
+            self._config_data["files"]["input_dir"] = env_input_dir
             
-        if env_output_dir := os.getenv("TIMESTAMP_OUTPUT_DIR"):
-            self.config_data["files"]["output_dir"] = env_output_dir
+        if "TIMESTAMP_OUTPUT_DIR" in present and (env_output_dir := os.environ["TIMESTAMP_OUTPUT_DIR"]):
+            self._config_data["files"]["output_dir"] = env_output_dir
         
         # File encoding
-        if env_encoding := os.getenv("TIMESTAMP_ENCODING"):
-            self.config_data["files"]["encoding"] = env_encoding
+        if "TIMESTAMP_ENCODING" in present and (env_encoding := os.environ["TIMESTAMP_ENCODING"]):
+            self._config_data["files"]["encoding"] = env_encoding
     
     def get(self, key_path: str, default=None):
         """
         Get configuration value by dot-separated key path.
         
+        Lookups are cached until the configuration is reloaded or changed
+        through set(), unless config_data was handed out for editing.
+        
         Args:
             key_path: Dot-separated path like "timestamp.output_format"
             default: Default value if key not found
@@ -219,63 +460,103 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key_path.split('.')
-        value = self.config_data
+        self._ensure_loaded()
+        if key_path in self._get_cache and not self._data_exposed:
+            value = self._get_cache[key_path]
+            return default if value is _NOT_FOUND else value
         
-        for key in keys:
+        value = self._config_data
+        for key in key_path.split('.'):
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
-                return default
+                value = _NOT_FOUND
+                break
         
-        return value
+        self._get_cache[key_path] = value
+        return default if value is _NOT_FOUND else value
     
-    def get_timestamp_formats(self) -> List[Dict[str, Any]]:
-        """Get list of enabled timestamp input formats."""
-        all_formats = self.get("timestamp.input_formats", [])
-        # Filter to only return enabled formats
-        enabled_formats = [fmt for fmt in all_formats if fmt.get("enabled", True)]
-        return enabled_formats
+    def set(self, key_path: str, value: Any):
+        """
+        Set configuration value by dot-separated key path.
+        
+        Args:
+            key_path: Dot-separated path like "timestamp.output_format"
+            value: New value
+        """
+        self._ensure_loaded()
+        keys = key_path.split('.')
+        target = self._config_data
+        for key in keys[:-1]:
+            if not isinstance(target.get(key), dict):
+                target[key] = {}
+            target = target[key]
+        target[keys[-1]] = value
+        self._refresh_derived()
+    
+    def get_timestamp_formats(self) -> Tuple[Mapping[str, Any], ...]:
+        """Get read-only enabled timestamp input formats (invalid patterns are left out)."""
+        self._ensure_current()
+        if self._enabled_formats is None:
+            self._prepare_formats()
+        return self._enabled_formats
     
-    def get_all_timestamp_formats(self) -> List[Dict[str, Any]]:
-        """Get list of all timestamp input formats (including disabled ones)."""
-        return self.get("timestamp.input_formats", [])
+    def get_all_timestamp_formats(self) -> Tuple[Mapping[str, Any], ...]:
+        """Get read-only timestamp input formats (including disabled ones)."""
+        self._ensure_current()
+        if self._all_formats is None:
+            self._prepare_formats()
+        return self._all_formats
     
     def get_output_format(self) -> str:
         """Get timestamp output format template."""
-        return self.get("timestamp.output_format", "[{hours:02d}:{minutes:02d}:{seconds:02d}]")
+        self._ensure_current()
+        return self.output_format
     
     def get_input_dir(self) -> str:
         """Get default input directory."""
-        return self.get("files.input_dir", "inputs")
+        self._ensure_current()
+        return self.input_dir
     
     def get_output_dir(self) -> str:
         """Get default output directory."""
-        return self.get("files.output_dir", "outputs")
+        self._ensure_current()
+        return self.output_dir
     
     def get_encoding(self) -> str:
         """Get file encoding."""
-        return self.get("files.encoding", "utf-8")
+        self._ensure_current()
+        return self.encoding
     
     def get_output_template(self) -> str:
         """Get output filename template."""
-        return self.get("output_naming.template", "{basename}_{sign}{adjustment}s{extension}")
+        self._ensure_current()
+        return self.output_template
     
     def get_positive_sign(self) -> str:
         """Get positive adjustment sign."""
-        return self.get("output_naming.positive_sign", "plus")
+        self._ensure_current()
+        return self.positive_sign
     
     def get_negative_sign(self) -> str:
         """Get negative adjustment sign."""
-        return self.get("output_naming.negative_sign", "minus")
+        self._ensure_current()
+        return self.negative_sign
 
 
-# Global config instance
-_config_instance = None
+# Global config instances, keyed by resolved config file path (None for default lookup)
+_config_instances: Dict[Optional[str], Config] = {}
 
 def get_config(config_file: Optional[str] = None) -> Config:
     """Get global configuration instance."""
-    global _config_instance
-    if _config_instance is None or config_file is not None:
-        _config_instance = Config(config_file)
-    return _config_instance
+    key = str(Path(config_file).resolve()) if config_file else None
+    instance = _config_instances.get(key)
+    if instance is None:
+        instance = Config(config_file)
+        _config_instances[key] = instance
+    return instance
+
+
+def invalidate() -> None:
+    """Drop cached global configuration instances so the next get_config() reloads."""
+    _config_instances.clear()
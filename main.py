@@ -4,13 +4,195 @@ Timestamp Adjuster - Adjusts timestamps in transcript files.
 Supports configurable timestamp formats via YAML configuration.
 """
 
+import os
 import re
-import argparse
+import codecs
+import mmap
+import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, AnyStr, Tuple, Callable, NamedTuple, Union
 
-from config import get_config
+# The regex parser is private to CPython; without it (or if its interface
+# changes) _required_literal finds nothing and the prefilter is disabled
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except Exception:
+    try:
+        import sre_parse as _sre_parse
+    except Exception:
+        _sre_parse = None
+
+
+# Timestamp patterns are matched with ASCII semantics (\d, \w and \b only
+# match ASCII), the same whether a file is scanned as bytes or as text
+_PATTERN_FLAGS = re.ASCII
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern:
+    """Compile a single timestamp pattern (cached)."""
+    return re.compile(pattern, _PATTERN_FLAGS)
+
+
+def _compile_alternation(source: AnyStr):
+    """
+    Compile the combined timestamp pattern, with re2 if TIMESTAMP_REGEX_ENGINE=re2.
+    
+    re2 matches alternations in linear time. It is optional: if the module is
+    missing or rejects the pattern, the standard re module is used instead.
+    
+    Args:
+        source (AnyStr): Combined pattern source
+        
+    Returns:
+        Compiled pattern with the re.Pattern interface
+    """
+    if os.environ.get("TIMESTAMP_REGEX_ENGINE") == "re2":
+        try:
+            import re2
+            return re2.compile(source)
+        except Exception:  # Not installed, or a construct re2 does not support
+            pass
+    return re.compile(source, _PATTERN_FLAGS)
+
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """
+    Find a character that every match of a pattern must contain.
+    
+    Only the mandatory parts of the pattern are inspected (top-level sequence,
+    groups and repeats with a minimum of one); alternations and classes are
+    skipped, so the result is conservative.
+    
+    Args:
+        pattern (str): Regular expression
+        
+    Returns:
+        Optional[str]: A required character, or None if none could be found
+    """
+    if _sre_parse is None:
+        return None
+    try:
+        parsed = _sre_parse.parse(pattern)
+        if parsed.state.flags & re.IGNORECASE:
+            return None
+        
+        items = list(parsed)
+        while items:
+            op, av = items.pop(0)
+            if op is _sre_parse.LITERAL:
+                return chr(av)
+            if op is _sre_parse.SUBPATTERN:
+                _, add_flags, _, sub = av
+                if not add_flags & re.IGNORECASE:
+                    items[0:0] = list(sub)
+            elif op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT) and av[0] >= 1:
+                items[0:0] = list(av[2])
+    except Exception:  # Unparseable pattern, or a parser interface this code does not know
+        return None
+    return None
+
+
+# Seconds per unit for the time component names a format's "groups" may use
+_GROUP_SECONDS = {"hours": 3600, "minutes": 60, "seconds": 1}
+
+# Values of the one- and two-digit fields timestamps are made of, so most
+# components decode with a dict lookup; anything else falls back to int()
+_DIGITS = {**{str(n): n for n in range(10)}, **{f"{n:02d}": n for n in range(100)}}
+_DIGITS_BYTES = {key.encode('ascii'): value for key, value in _DIGITS.items()}
+
+# Upper bound on the rendered timestamps an adjuster remembers before starting over
+_MEMO_LIMIT = 4096
+
+
+@lru_cache(maxsize=32)
+def _build_matcher(formats_key: Tuple[Tuple[str, Tuple[str, ...]], ...], binary: bool = False) -> Tuple[re.Pattern, Dict[int, Tuple[Tuple[int, int], ...]], Optional[tuple]]:
+    """
+    Build the combined pattern plus a table for reading time components straight from its groups.
+    
+    Args:
+        formats_key: (pattern, group names) for each enabled format, in priority order
+        binary: Compile a bytes pattern (all patterns must be ASCII)
+        
+    Returns:
+        Tuple: Combined pattern; a dict mapping the wrapping group index of
+        each alternative (Match.lastindex) to (group index, seconds per unit)
+        pairs; and literals of which any text containing a timestamp must
+        contain at least one (None if they cannot be determined)
+    """
+    patterns = tuple(pattern for pattern, _ in formats_key)
+    
+    literals = set()
+    for pattern in patterns:
+        literal = _required_literal(pattern)
+        if literal is None:
+            literals = None
+            break
+        literals.add(literal.encode('latin-1') if binary else literal)
+    prefilter = tuple(literals) if literals is not None else None
+    source = '|'.join(f'({pattern})' for pattern in patterns)
+    combined = _compile_alternation(source.encode('ascii') if binary else source)
+    
+    group_table = {}
+    offset = 1
+    for pattern, groups in formats_key:
+        group_table[offset] = tuple(
+            (offset + index, unit_seconds) for index, unit_seconds in _group_units(groups)
+        )
+        offset += 1 + _compile(pattern).groups
+    
+    return combined, group_table, prefilter
+
+
+# The stock [HH:MM:SS] input format, which parse_timestamp recognises without re
+_BRACKETED_HMS_PATTERN = r'\[(\d{2}):(\d{2}):(\d{2})\]'
+_HMS_GROUPS = ("hours", "minutes", "seconds")
+
+
+# Keys derived by _enabled_formats_key for Config's tuples of read-only formats,
+# by id (each entry keeps its tuple alive, so the id cannot be reused while it is cached)
+_formats_keys: Dict[int, Tuple[tuple, Tuple[Tuple[str, Tuple[str, ...]], ...], bool]] = {}
+
+
+def _enabled_formats_key(formats) -> Tuple[Tuple[Tuple[str, Tuple[str, ...]], ...], bool]:
+    """
+    Reduce formats to (pattern, group names) pairs of the enabled ones.
+    
+    Tuples of read-only mappings, as returned by Config.get_timestamp_formats,
+    are only reduced once. That is safe for Config's tuples: Config hands out
+    the same tuple until the configuration changes, and keeps the only
+    reference to the dicts behind the read-only views. A caller building its
+    own tuple of MappingProxyType views must not edit the underlying dicts
+    afterwards. Anything else, such as a list or a tuple of plain dicts, is
+    reduced on every call.
+    
+    Args:
+        formats: Format configurations
+        
+    Returns:
+        Tuple: The formats key, and whether the first enabled format is the
+        stock [HH:MM:SS] one
+    """
+    if type(formats) is tuple:
+        cached = _formats_keys.get(id(formats))
+        if cached is not None and cached[0] is formats:
+            return cached[1], cached[2]
+    
+    formats_key = tuple(
+        (fmt["pattern"], tuple(fmt["groups"]))
+        for fmt in formats
+        if fmt.get("enabled", True)  # Skip disabled formats
+    )
+    bracketed_first = bool(formats_key) and formats_key[0] == (_BRACKETED_HMS_PATTERN, _HMS_GROUPS)
+    
+    if type(formats) is tuple and all(type(fmt) is MappingProxyType for fmt in formats):
+        if len(_formats_keys) >= 32:
+            _formats_keys.clear()
+        _formats_keys[id(formats)] = (formats, formats_key, bracketed_first)
+    return formats_key, bracketed_first
 
 
 def parse_timestamp(timestamp_str, formats: List[Dict[str, Any]]) -> Optional[int]:
@@ -24,29 +206,101 @@ def parse_timestamp(timestamp_str, formats: List[Dict[str, Any]]) -> Optional[in
     Returns:
         Optional[int]: Total seconds if parsed successfully, None otherwise
     """
-    for fmt in formats:
-        # Skip disabled formats
-        if not fmt.get("enabled", True):
-            continue
-            
-        pattern = fmt["pattern"]
-        groups = fmt["groups"]
-        
-        match = re.search(pattern, timestamp_str)
-        if match:
-            # Extract time components based on group names
-            time_parts = {}
-            for i, group_name in enumerate(groups, 1):
-                time_parts[group_name] = int(match.group(i))
-            
-            # Calculate total seconds
-            hours = time_parts.get("hours", 0)
-            minutes = time_parts.get("minutes", 0) 
-            seconds = time_parts.get("seconds", 0)
-            
-            return hours * 3600 + minutes * 60 + seconds
+    formats_key, bracketed_first = _enabled_formats_key(formats)
     
-    return None
+    # Fast path for a leading [HH:MM:SS] when that is the first format: it is
+    # what the regex would find first, so check the fixed positions directly
+    if (bracketed_first and len(timestamp_str) >= 10 and timestamp_str[0] == '['
+            and timestamp_str[3] == ':' and timestamp_str[6] == ':' and timestamp_str[9] == ']'
+            and timestamp_str[1:9].isascii() and timestamp_str[1:3].isdecimal()
+            and timestamp_str[4:6].isdecimal() and timestamp_str[7:9].isdecimal()):
+        return int(timestamp_str[1:3]) * 3600 + int(timestamp_str[4:6]) * 60 + int(timestamp_str[7:9])
+    
+    return _parse_cached(timestamp_str, formats_key)
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(timestamp_str, formats_key: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Optional[int]:
+    """Parse a timestamp against (pattern, group names) pairs; repeated timestamps hit the cache."""
+    if not formats_key:
+        return None
+    
+    # One search over all formats finds the leftmost timestamp of any format
+    try:
+        combined_pattern, group_table, _ = _build_matcher(formats_key)
+    except re.error:
+        # Patterns that cannot be combined (e.g. with leading inline flags
+        # such as (?i)) are tried one at a time, in priority order
+        for pattern, groups in formats_key:
+            match = _compile(pattern).search(timestamp_str)
+            if match:
+                return _sum_groups(match, _group_units(groups))
+        return None
+    match = combined_pattern.search(timestamp_str)
+    if match is None:
+        return None
+    
+    # Formats take priority in order; one listed before the format that
+    # matched can only occur further right, so check those before accepting
+    position = list(group_table).index(match.lastindex)
+    for pattern, groups in formats_key[:position]:
+        earlier = _compile(pattern).search(timestamp_str, match.start() + 1)
+        if earlier:
+            return _sum_groups(earlier, _group_units(groups))
+    return _sum_groups(match, group_table[match.lastindex])
+
+
+def _sum_groups(match: re.Match, units: Tuple[Tuple[int, int], ...]) -> int:
+    """Total seconds from (group index, seconds per unit) pairs of a match."""
+    total_seconds = 0
+    for index, unit_seconds in units:
+        value = match.group(index)
+        if value is not None:
+            number = _DIGITS.get(value)
+            total_seconds += (int(value) if number is None else number) * unit_seconds
+    return total_seconds
+
+
+@lru_cache(maxsize=64)
+def _group_units(groups: Tuple[str, ...]) -> Tuple[Tuple[int, int], ...]:
+    """Map a format's group names to (group index, seconds per unit) pairs, dropping unknown names."""
+    return tuple(
+        (index, _GROUP_SECONDS[name])
+        for index, name in enumerate(groups, 1)
+        if name in _GROUP_SECONDS
+    )
+
+
+# Zero-padded two-digit strings, so common values skip int.__format__
+_PAD2 = tuple(f"{i:02d}" for i in range(100))
+
+# Specialised formatters for the common output templates, skipping str.format parsing
+# (minutes and seconds are always below 60; hours of 100 or more take the slow path)
+_FAST_FORMATTERS = {
+    "[{hours:02d}:{minutes:02d}:{seconds:02d}]":
+        lambda h, m, s: f"[{_PAD2[h]}:{_PAD2[m]}:{_PAD2[s]}]" if h < 100 else f"[{h:02d}:{m:02d}:{s:02d}]",
+    "{hours:02d}:{minutes:02d}:{seconds:02d}":
+        lambda h, m, s: f"{_PAD2[h]}:{_PAD2[m]}:{_PAD2[s]}" if h < 100 else f"{h:02d}:{m:02d}:{s:02d}",
+}
+
+
+@lru_cache(maxsize=32)
+def _get_formatter(output_format: str) -> Callable[[int, int, int], str]:
+    """
+    Get a function formatting (hours, minutes, seconds) with the given output template.
+    
+    Args:
+        output_format (str): Format template string
+        
+    Returns:
+        Callable: Formatter taking hours, minutes and seconds
+    """
+    fast = _FAST_FORMATTERS.get(output_format)
+    if fast is not None:
+        return fast
+    
+    template = output_format.format
+    return lambda h, m, s: template(hours=h, minutes=m, seconds=s)
 
 
 def seconds_to_timestamp(total_seconds: int, output_format: str) -> str:
@@ -63,88 +317,227 @@ def seconds_to_timestamp(total_seconds: int, output_format: str) -> str:
     # Handle negative timestamps by setting them to 00:00:00
     if total_seconds < 0:
         total_seconds = 0
+    
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    
+    return _get_formatter(output_format)(hours, minutes, seconds)
+
+
+# Codecs that encode ASCII characters as the same single bytes
+_ASCII_COMPATIBLE_CODECS = {"utf-8", "ascii", "iso8859-1", "cp1252"}
+
+
+def _binary_encoding(config) -> Optional[str]:
+    """
+    Check whether timestamps can be adjusted on the raw file bytes.
+    
+    That is the case when the file encoding is ASCII-compatible and every
+    enabled pattern is pure ASCII, so matching never depends on decoding.
+    
+    Args:
+        config: Configuration object
         
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+    Returns:
+        Optional[str]: The encoding to use for rendered timestamps, or None
+        if the file has to be decoded
+    """
+    encoding = config.get_encoding()
+    try:
+        if codecs.lookup(encoding).name not in _ASCII_COMPATIBLE_CODECS:
+            return None
+    except LookupError:
+        return None
+    if not all(fmt["pattern"].isascii() for fmt in config.get_timestamp_formats()):
+        return None
+    return encoding
+
+
+# The stock output template, which renders [HH:MM:SS] input exactly as it was
+_BRACKETED_HMS_FORMAT = "[{hours:02d}:{minutes:02d}:{seconds:02d}]"
+
+
+def _renders_unchanged(config) -> bool:
+    """
+    Check whether re-rendering unadjusted timestamps reproduces them exactly.
     
-    return output_format.format(
-        hours=hours,
-        minutes=minutes, 
-        seconds=seconds
-    )
+    A zero adjustment still renders every timestamp in the output format (so
+    e.g. [3:45:20] becomes [03:45:20]); only for the stock [HH:MM:SS] input
+    and output pair is that provably a no-op.
+    
+    Args:
+        config: Configuration object
+        
+    Returns:
+        bool: True if only [HH:MM:SS] is matched and rendered as [HH:MM:SS]
+    """
+    formats_key, _ = _enabled_formats_key(config.get_timestamp_formats())
+    return (formats_key == ((_BRACKETED_HMS_PATTERN, _HMS_GROUPS),)
+            and config.get_output_format() == _BRACKETED_HMS_FORMAT)
 
 
-def adjust_timestamps(content: str, adjustment_seconds: int, config) -> str:
+def _make_adjuster(adjustment_seconds: int, config, binary_encoding: Optional[str] = None) -> Callable[..., Optional[AnyStr]]:
     """
-    Adjust all timestamps in the content by the specified number of seconds.
+    Build a function that adjusts all timestamps in a piece of text.
+    
+    The combined pattern, group table and formatter are resolved once, so the
+    returned function can be applied cheaply to many lines or chunks. When
+    called with a write callable, the function passes the adjusted text to it
+    piece by piece instead of returning it (the content may then be any
+    buffer the regex can scan, such as an mmap).
     
     Args:
-        content (str): The transcript content
         adjustment_seconds (int): Number of seconds to adjust (can be negative)
         config: Configuration object
+        binary_encoding (Optional[str]): If set, the function works on bytes
+            (see _binary_encoding) and encodes timestamps with this encoding
         
     Returns:
-        str: Content with adjusted timestamps
+        Callable: Function returning the text with adjusted timestamps
     """
     formats = config.get_timestamp_formats()
-    output_format = config.get_output_format()
+    if not formats or (adjustment_seconds == 0 and _renders_unchanged(config)):
+        # Nothing would change: leave the text untouched
+        return lambda content, write=None: content if write is None else write(content)
     
+    return _cached_adjuster(
+        tuple((fmt["pattern"], tuple(fmt["groups"])) for fmt in formats),
+        config.get_output_format(),
+        adjustment_seconds,
+        binary_encoding,
+    )
+
+
+@lru_cache(maxsize=32)
+def _cached_adjuster(formats_key: Tuple[Tuple[str, Tuple[str, ...]], ...], output_format: str,
+                     adjustment_seconds: int, binary_encoding: Optional[str]) -> Callable[..., Optional[AnyStr]]:
+    """Build the adjuster for _make_adjuster, reused across calls with the same settings."""
     # Create a combined pattern from all input formats
-    all_patterns = [fmt["pattern"] for fmt in formats]
-    combined_pattern = '|'.join(f'({pattern})' for pattern in all_patterns)
+    combined_pattern, group_table, prefilter = _build_matcher(formats_key, binary_encoding is not None)
+    finditer = combined_pattern.finditer
+    decode_digits = (_DIGITS if binary_encoding is None else _DIGITS_BYTES).get
+    format_timestamp = _get_formatter(output_format)
+    if binary_encoding is not None:
+        format_text = format_timestamp
+        format_timestamp = lambda h, m, s: format_text(h, m, s).encode(binary_encoding)
+    
+    # Rendered replacement per (alternative, matched text); transcripts repeat
+    # timestamps a lot (e.g. cue end/start pairs), which then skip decoding and formatting
+    memo = {}
+    
+    def replace(match: re.Match) -> AnyStr:
+        group = match.group
+        lastindex = match.lastindex
+        key = (lastindex, group())
+        replacement = remembered(key)
+        if replacement is None:
+            # The alternative that matched is the last group to close; read its
+            # time components directly instead of re-parsing the matched text
+            total_seconds = adjustment_seconds
+            for index, unit_seconds in group_table[lastindex]:
+                value = group(index)
+                if value is not None:
+                    number = decode_digits(value)
+                    if number is None:
+                        number = int(value)
+                    total_seconds += number * unit_seconds
+            
+            # Negative results clamp to zero
+            if total_seconds < 0:
+                total_seconds = 0
+            minutes, seconds = divmod(total_seconds, 60)
+            hours, minutes = divmod(minutes, 60)
+            replacement = format_timestamp(hours, minutes, seconds)
+            
+            if len(memo) >= _MEMO_LIMIT:
+                memo.clear()
+            memo[key] = replacement
+        return replacement
     
-    def replace_timestamp(match):
-        # Find which pattern matched
-        matched_text = match.group(0)
+    remembered = memo.get
+    substitute = combined_pattern.sub
+    
+    def adjust(content: AnyStr, write: Optional[Callable[[AnyStr], Any]] = None) -> Optional[AnyStr]:
+        # Cheap substring scan first: skip the regex for text that cannot hold a timestamp
+        if prefilter is not None and not any(literal in content for literal in prefilter):
+            return content if write is None else write(content)
         
-        # Parse the matched timestamp
-        total_seconds = parse_timestamp(matched_text, formats)
-        if total_seconds is None:
-            return matched_text  # Return unchanged if parsing failed
+        if write is None:
+            # Scanning, slicing and joining all happen inside re; only the
+            # replacement of each match runs Python code
+            return substitute(replace, content)
         
-        # Adjust the timestamp
-        new_total_seconds = total_seconds + adjustment_seconds
+        # Hand unmatched slices and adjusted timestamps to write as they come
+        pos = 0
+        for match in finditer(content):
+            start, end = match.span()
+            write(content[pos:start])
+            write(replace(match))
+            pos = end
+        return write(content[pos:])
+    
+    return adjust
+
+
+def adjust_timestamps(content: str, adjustment_seconds: int, config) -> str:
+    """
+    Adjust all timestamps in the content by the specified number of seconds.
+    
+    Args:
+        content (str): The transcript content
+        adjustment_seconds (int): Number of seconds to adjust (can be negative)
+        config: Configuration object
         
-        # Convert back to timestamp format
-        return seconds_to_timestamp(new_total_seconds, output_format)
+    Returns:
+        str: Content with adjusted timestamps
+    """
+    return _make_adjuster(adjustment_seconds, config)(content)
+
+
+# Directories already created (or found) by _ensure_dir during this run
+# (process_file drops one again if it has disappeared since)
+_ensured_dirs = set()
+
+
+def _ensure_dir(directory: Path) -> None:
+    """
+    Create a directory (and its parents) unless this run already did.
     
-    # Replace all timestamps in the content
-    adjusted_content = re.sub(combined_pattern, replace_timestamp, content)
-    return adjusted_content
+    Args:
+        directory (Path): Directory that must exist
+    """
+    if directory not in _ensured_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(directory)
 
 
-def generate_output_filename(input_file: str, adjustment_seconds: int, config) -> Path:
+def generate_output_filename(input_file: Union[str, Path], adjustment_seconds: int, config) -> Path:
     """
     Generate an output filename based on the input file and adjustment.
     
     Args:
-        input_file (str): Path to input file
+        input_file (Union[str, Path]): Path to input file
         adjustment_seconds (int): Number of seconds adjusted
         config: Configuration object
         
     Returns:
         Path: Generated output file path in outputs folder
     """
-    input_path = Path(input_file)
+    input_path = input_file if isinstance(input_file, Path) else Path(input_file)
     
-    # Create outputs directory if it doesn't exist
+    # The outputs directory is created by process_file right before writing,
+    # keeping this a pure name computation
     outputs_dir = Path(config.get_output_dir())
-    outputs_dir.mkdir(exist_ok=True)
     
     # Get the base filename without extension
     base_name = input_path.stem
     extension = input_path.suffix
     
     # Generate sign and template variables
-    if adjustment_seconds >= 0:
-        sign = config.get_positive_sign()
-    else:
-        sign = config.get_negative_sign()
+    sign = config.get_positive_sign() if adjustment_seconds >= 0 else config.get_negative_sign()
     
     # Format filename using template
-    template = config.get_output_template()
-    output_filename = template.format(
+    output_filename = config.get_output_template().format(
         basename=base_name,
         extension=extension,
         adjustment=abs(adjustment_seconds),
@@ -155,7 +548,26 @@ def generate_output_filename(input_file: str, adjustment_seconds: int, config) -
     return output_path
 
 
-def process_file(input_file: str, output_file: Optional[str], adjustment_seconds: int, config) -> bool:
+def _write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write a complete output in as few syscalls as possible (one for regular files).
+    
+    Args:
+        path (Path): File to create or truncate
+        data (bytes): Encoded content
+    """
+    with open(path, 'wb', buffering=0) as f:
+        view = memoryview(data)
+        while view:
+            view = view[f.write(view):]
+
+
+# Inputs at least this large (in bytes) are adjusted through mmap when working on raw bytes
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+def process_file(input_file: str, output_file: Optional[str], adjustment_seconds: int, config,
+                 content: Optional[str] = None) -> bool:
     """
     Process a transcript file and adjust all timestamps.
     
@@ -164,68 +576,201 @@ def process_file(input_file: str, output_file: Optional[str], adjustment_seconds
         output_file (Optional[str]): Path to output file (if None, auto-generates in outputs folder)
         adjustment_seconds (int): Number of seconds to adjust
         config: Configuration object
+        content (Optional[str]): Already decoded content of the input file
+            (with untranslated line endings, see preview_file_content); if
+            given, the input is not read again
     """
     input_path = Path(input_file)
     
-    if not input_path.exists():
+    # One stat serves both the existence check and the size check below
+    try:
+        input_size = input_path.stat().st_size
+    except OSError:
         print(f"Error: Input file '{input_file}' not found.")
         return False
     
+    output_path = None
     try:
-        # Read the input file
         encoding = config.get_encoding()
-        with open(input_path, 'r', encoding=encoding) as f:
-            content = f.read()
         
-        # Adjust timestamps
-        adjusted_content = adjust_timestamps(content, adjustment_seconds, config)
+        # Work on raw bytes when possible, skipping a decode/encode of the whole
+        # file (unless the decoded content was handed in)
+        binary_encoding = _binary_encoding(config) if content is None else None
+        adjust = _make_adjuster(adjustment_seconds, config, binary_encoding)
+        if binary_encoding is not None:
+            read_mode, write_mode, open_kwargs = 'rb', 'wb', {}
+        else:
+            # Keep line endings as they are, like the binary path
+            read_mode, write_mode, open_kwargs = 'r', 'w', {'encoding': encoding, 'newline': ''}
         
         # Determine output file
         if output_file is None:
-            output_path = generate_output_filename(input_file, adjustment_seconds, config)
+            output_path = generate_output_filename(input_path, adjustment_seconds, config)
         else:
             output_path = Path(output_file)
         
         # Create output directory if it doesn't exist
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(output_path.parent)
         
-        # Write the adjusted content
-        with open(output_path, 'w', encoding=encoding) as f:
-            f.write(adjusted_content)
+        if adjustment_seconds == 0 and _renders_unchanged(config):
+            # Nothing would change: copy the bytes without decoding/encoding them
+            if not (output_path.exists() and output_path.samefile(input_path)):
+                shutil.copyfile(input_path, output_path)
+        elif content is not None:
+            # Content already read (e.g. for the preview): only the output is written
+            _write_bytes(output_path, adjust(content).encode(encoding))
+        elif output_path.exists() and output_path.samefile(input_path):
+            # Adjusting in place: the whole input must be read before truncating it
+            if binary_encoding is not None:
+                adjusted_data = adjust(input_path.read_bytes())
+            else:
+                with open(input_path, 'r', encoding=encoding, newline='') as f:
+                    adjusted_data = adjust(f.read()).encode(encoding)
+            _write_bytes(output_path, adjusted_data)
+        elif binary_encoding is not None and input_size >= _MMAP_THRESHOLD:
+            # Large file: scan a read-only mapping in one pass and write the
+            # pieces straight out, without reading the file into memory
+            with open(input_path, 'rb') as fin, \
+                 mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                 open(output_path, 'wb') as fout:
+                adjust(mapped, fout.write)
+        elif input_size < _MMAP_THRESHOLD:
+            # Small file: adjust it with a single substitution over the whole
+            # text instead of one call per line, then write it out at once
+            with open(input_path, read_mode, **open_kwargs) as fin:
+                adjusted_data = adjust(fin.read())
+            with open(output_path, write_mode, **open_kwargs) as fout:
+                fout.write(adjusted_data)
+        else:
+            # Large text file: stream line by line (timestamps never span lines),
+            # keeping memory flat
+            with open(input_path, read_mode, **open_kwargs) as fin, \
+                 open(output_path, write_mode, **open_kwargs) as fout:
+                write = fout.write
+                for line in fin:
+                    write(adjust(line))
         
         print(f"Successfully adjusted timestamps by {adjustment_seconds} seconds.")
         print(f"Output written to: {output_path}")
         return True
         
+    except FileNotFoundError as e:
+        # The output directory may have been removed (or the working directory
+        # changed) since _ensure_dir created it: forget it and try again
+        if output_path is not None and output_path.parent in _ensured_dirs and not output_path.parent.is_dir():
+            _ensured_dirs.discard(output_path.parent)
+            return process_file(input_file, output_file, adjustment_seconds, config, content)
+        print(f"Error processing file: {e}")
+        return False
     except Exception as e:
         print(f"Error processing file: {e}")
         return False
 
 
-def list_input_files() -> List[Path]:
+def _process_file_task(task: Tuple[str, int, Optional[str], Optional[str]]) -> bool:
+    """
+    Process one file of a batch, loading the configuration in the current process.
+    
+    Args:
+        task (Tuple): Input file, adjustment in seconds, config file and output format override
+        
+    Returns:
+        bool: Whether the file was processed successfully
+    """
+    from config import get_config
+    
+    input_file, adjustment_seconds, config_file, output_format = task
+    config = get_config(config_file)
+    if output_format:
+        config.set("timestamp.output_format", output_format)
+    return process_file(input_file, None, adjustment_seconds, config)
+
+
+def process_files(input_files: List[str], adjustment_seconds: int, config_file: Optional[str] = None,
+                  output_format: Optional[str] = None, workers: Optional[int] = None) -> List[bool]:
+    """
+    Process several transcript files in parallel, each into the outputs folder.
+    
+    Files are independent, so each one is handled in a worker process (which
+    loads its own configuration) to use all cores. Files whose outputs would
+    have the same name (e.g. a/x.txt and b/x.txt) are not processed, since
+    they would overwrite each other.
+    
+    Args:
+        input_files (List[str]): Paths to input transcript files
+        adjustment_seconds (int): Number of seconds to adjust
+        config_file (Optional[str]): Configuration file path (default: searches for config.yaml)
+        output_format (Optional[str]): Override for the output timestamp format
+        workers (Optional[int]): Number of worker processes (default: one per CPU)
+        
+    Returns:
+        List[bool]: Success of each file, in input order
+    """
+    from config import get_config
+    
+    # Group the inputs by output file before any worker starts writing
+    config = get_config(config_file)
+    inputs_by_output: Dict[Path, List[int]] = {}
+    for index, input_file in enumerate(input_files):
+        output_path = generate_output_filename(input_file, adjustment_seconds, config)
+        inputs_by_output.setdefault(output_path, []).append(index)
+    
+    results: List[Optional[bool]] = [None] * len(input_files)
+    for output_path, indexes in inputs_by_output.items():
+        if len(indexes) > 1:
+            names = ", ".join(f"'{input_files[index]}'" for index in indexes)
+            print(f"Error: {names} would all be written to '{output_path}'; skipping them.")
+            for index in indexes:
+                results[index] = False
+    
+    pending = [index for index, result in enumerate(results) if result is None]
+    tasks = [(input_files[index], adjustment_seconds, config_file, output_format) for index in pending]
+    if len(tasks) <= 1 or workers == 1:
+        outcomes = [_process_file_task(task) for task in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_process_file_task, tasks))
+    
+    for index, outcome in zip(pending, outcomes):
+        results[index] = outcome
+    return results
+
+
+class InputFile(NamedTuple):
+    """An input file together with the size recorded when its directory was listed."""
+    path: Path
+    size: int
+    
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+def list_input_files() -> List[InputFile]:
     """
     List all files in the inputs directory (excluding test files and directories).
     
     Returns:
-        List[Path]: List of available input files
+        List[InputFile]: List of available input files
     """
-    inputs_dir = Path("inputs")
-    if not inputs_dir.exists():
+    # One directory read; DirEntry caches the file type and stat result
+    try:
+        with os.scandir("inputs") as entries:
+            files = [
+                InputFile(Path(entry.path), entry.stat().st_size)
+                for entry in entries
+                if (entry.is_file() and
+                    not entry.name.startswith(('.', 'test_')) and
+                    not entry.name.endswith('.py'))
+            ]
+    except FileNotFoundError:
         return []
     
-    # Get all files, excluding test files and python files
-    files = []
-    for file_path in inputs_dir.iterdir():
-        if (file_path.is_file() and 
-            not file_path.name.startswith('.') and 
-            not file_path.name.startswith('test_') and
-            not file_path.name.endswith('.py')):
-            files.append(file_path)
-    
     return sorted(files)
 
 
-def display_file_menu(files: List[Path]) -> None:
+def display_file_menu(files: List[InputFile]) -> None:
     """Display a numbered menu of available files."""
     print("\n📁 Available files in inputs folder:")
     print("=" * 40)
@@ -234,21 +779,21 @@ def display_file_menu(files: List[Path]) -> None:
         print("No files found in inputs folder.")
         return
     
-    for i, file_path in enumerate(files, 1):
-        file_size = file_path.stat().st_size
+    for i, input_file in enumerate(files, 1):
+        file_size = input_file.size
         size_str = f"{file_size:,} bytes" if file_size < 1024 else f"{file_size/1024:.1f} KB"
-        print(f"  {i}. {file_path.name} ({size_str})")
+        print(f"  {i}. {input_file.name} ({size_str})")
 
 
-def get_user_file_selection(files: List[Path]) -> Optional[Path]:
+def get_user_file_selection(files: List[InputFile]) -> Optional[InputFile]:
     """
     Get user's file selection from the menu.
     
     Args:
-        files (List[Path]): List of available files
+        files (List[InputFile]): List of available files
         
     Returns:
-        Optional[Path]: Selected file path or None if cancelled
+        Optional[InputFile]: Selected file or None if cancelled
     """
     if not files:
         return None
@@ -312,7 +857,7 @@ def get_time_adjustment() -> Optional[int]:
             print("Please enter a valid number or 'q' to quit.")
 
 
-def preview_file_content(file_path: Path, config, max_lines: int = 10) -> None:
+def preview_file_content(file_path: Path, config, max_lines: int = 10) -> Optional[str]:
     """
     Show a preview of the file content with timestamp highlighting.
     
@@ -320,30 +865,41 @@ def preview_file_content(file_path: Path, config, max_lines: int = 10) -> None:
         file_path (Path): File to preview
         config: Configuration object
         max_lines (int): Maximum lines to show
+        
+    Returns:
+        Optional[str]: The decoded file content (line endings untouched) for
+        reuse by process_file, or None if the file could not be read
     """
     try:
         encoding = config.get_encoding()
-        with open(file_path, 'r', encoding=encoding) as f:
+        with open(file_path, 'r', encoding=encoding, newline='') as f:
             lines = f.readlines()
         
         print(f"\n📄 Preview of {file_path.name} (first {min(len(lines), max_lines)} lines):")
         print("-" * 50)
         
-        formats = config.get_timestamp_formats()
-        all_patterns = [fmt["pattern"] for fmt in formats if fmt.get("enabled", True)]
-        combined_pattern = '|'.join(f'({pattern})' for pattern in all_patterns)
+        # The same combined pattern (and prefilter) the adjustment uses
+        formats_key, _ = _enabled_formats_key(config.get_timestamp_formats())
+        combined_pattern, _, prefilter = _build_matcher(formats_key)
+        highlight = combined_pattern.sub
         
         for i, line in enumerate(lines[:max_lines], 1):
             line = line.rstrip()
             # Highlight timestamps with brackets
-            highlighted_line = re.sub(combined_pattern, r'[\033[93m\g<0>\033[0m]', line)
+            if prefilter is not None and not any(literal in line for literal in prefilter):
+                highlighted_line = line
+            else:
+                highlighted_line = highlight(r'[\033[93m\g<0>\033[0m]', line)
             print(f"  {i:2d}: {highlighted_line}")
         
         if len(lines) > max_lines:
             print(f"  ... ({len(lines) - max_lines} more lines)")
+        
+        return ''.join(lines)
             
     except Exception as e:
         print(f"Error reading file: {e}")
+        return None
 
 
 def interactive_mode():
@@ -353,7 +909,8 @@ def interactive_mode():
     print("Welcome! This tool helps you adjust timestamps in transcript files.")
     print("Let's get started by selecting a file and adjustment amount.\n")
     
-    # Load configuration
+    # Load configuration (imported here so library use of this module skips PyYAML)
+    from config import get_config
     config = get_config()
     
     while True:
@@ -376,8 +933,9 @@ def interactive_mode():
         
         # Show file preview
         show_preview = input("Would you like to see a preview of the file? (y/n): ").strip().lower()
+        content = None
         if show_preview in ['y', 'yes']:
-            preview_file_content(selected_file, config)
+            content = preview_file_content(selected_file.path, config)
         
         # Get time adjustment
         adjustment_seconds = get_time_adjustment()
@@ -387,7 +945,7 @@ def interactive_mode():
         
         # Process the file
         print(f"\n🔄 Processing {selected_file.name}...")
-        success = process_file(str(selected_file), None, adjustment_seconds, config)
+        success = process_file(str(selected_file.path), None, adjustment_seconds, config, content)
         
         if success:
             print("✅ File processed successfully!")
@@ -402,8 +960,83 @@ def interactive_mode():
             break
 
 
-def main():
-    """Main function to run the timestamp adjuster."""
+class _CliArgs(NamedTuple):
+    """Parsed command line arguments."""
+    input_file: Optional[str] = None
+    adjustment: Optional[int] = None
+    output_file: Optional[str] = None
+    config_file: Optional[str] = None
+    output_format: Optional[str] = None
+    interactive: bool = False
+    batch: bool = False
+
+
+# Options taking a value, by spelling, mapped to their _CliArgs field
+_VALUE_OPTIONS = {
+    '-o': 'output_file', '--output': 'output_file',
+    '-c': 'config_file', '--config': 'config_file',
+    '-f': 'output_format', '--format': 'output_format',
+}
+
+
+def _is_negative_number(token: str) -> bool:
+    """Check whether a token that starts with '-' is a negative number rather than an option."""
+    return re.fullmatch(r'-\d+|-\d*\.\d+', token) is not None
+
+
+def _parse_args_fast(argv: List[str]) -> Optional[_CliArgs]:
+    """
+    Parse the common command line forms without importing argparse.
+    
+    Args:
+        argv (List[str]): Arguments without the program name
+        
+    Returns:
+        Optional[_CliArgs]: Parsed arguments, or None if the command line needs
+        argparse (help, errors, or less common option spellings)
+    """
+    values = {}
+    positionals = []
+    tokens = iter(argv)
+    for token in tokens:
+        if token in _VALUE_OPTIONS:
+            value = next(tokens, None)
+            if value is None or (value.startswith('-') and not _is_negative_number(value)):
+                return None
+            values[_VALUE_OPTIONS[token]] = value
+        elif token in ('-i', '--interactive'):
+            values['interactive'] = True
+        elif token in ('-b', '--batch'):
+            values['batch'] = True
+        elif token.startswith('-') and not _is_negative_number(token):
+            return None
+        else:
+            positionals.append(token)
+    
+    if len(positionals) > 2:
+        return None
+    if len(positionals) == 2:
+        try:
+            values['adjustment'] = int(positionals[1])
+        except ValueError:
+            return None
+    if positionals:
+        values['input_file'] = positionals[0]
+    return _CliArgs(**values)
+
+
+def _parse_args_full(argv: List[str]) -> _CliArgs:
+    """
+    Parse the command line with argparse, for help output and error messages.
+    
+    Args:
+        argv (List[str]): Arguments without the program name
+        
+    Returns:
+        _CliArgs: Parsed arguments
+    """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Adjust timestamps in transcript files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -413,6 +1046,7 @@ Examples:
   python main.py inputs/transcript.txt 3          # Creates outputs/transcript_plus_3s.txt
   python main.py inputs/transcript.txt -5         # Creates outputs/transcript_minus_5s.txt
   python main.py inputs/file.txt 10 -o output.txt # Creates output.txt in current directory
+  python main.py -b "inputs/*.txt" 4              # Adjusts every matching file, in parallel
         """
     )
     
@@ -427,11 +1061,30 @@ Examples:
                        help='Override output timestamp format (e.g., "[{hours:02d}:{minutes:02d}:{seconds:02d}]")')
     parser.add_argument('-i', '--interactive', action='store_true',
                        help='Run in interactive mode')
+    parser.add_argument('-b', '--batch', action='store_true',
+                       help='Treat input_file as a glob pattern and process all matching files in parallel')
     
-    args = parser.parse_args()
+    return _CliArgs(**vars(parser.parse_args(argv)))
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main function to run the timestamp adjuster.
+    
+    Args:
+        argv (Optional[List[str]]): Command line arguments without the program
+            name (default: sys.argv[1:])
+    """
+    # Imported here to keep importing this module as a library cheap
+    from config import get_config
+    
+    # Plain invocations skip argparse; anything else gets its help and errors
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _parse_args_fast(argv) or _parse_args_full(argv)
     
     # If no arguments provided or interactive flag is set, run interactive mode
-    if len(sys.argv) == 1 or args.interactive or (args.input_file is None and args.adjustment is None):
+    if not argv or args.interactive or (args.input_file is None and args.adjustment is None):
         interactive_mode()
         return
     
@@ -442,12 +1095,30 @@ Examples:
         print("Or run 'python main.py' for interactive mode.")
         sys.exit(1)
     
+    if args.batch:
+        if args.output_file:
+            print("Error: --output cannot be used with --batch; results go to the outputs folder.")
+            sys.exit(1)
+        
+        import glob
+        input_files = sorted(path for path in glob.glob(args.input_file) if os.path.isfile(path))
+        if not input_files:
+            print(f"Error: No files match '{args.input_file}'.")
+            sys.exit(1)
+        
+        # Workers load the configuration themselves
+        results = process_files(input_files, args.adjustment, args.config_file, args.output_format)
+        print(f"Processed {sum(results)} of {len(results)} files.")
+        if not all(results):
+            sys.exit(1)
+        return
+    
     # Load configuration
     config = get_config(args.config_file)
     
     # Override output format if specified
     if args.output_format:
-        config.config_data["timestamp"]["output_format"] = args.output_format
+        config.set("timestamp.output_format", args.output_format)
     
     # Process the file
     success = process_file(args.input_file, args.output_file, args.adjustment, config)
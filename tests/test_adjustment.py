@@ -6,9 +6,12 @@ Tests for timestamp adjustment functionality.
 import sys
 import os
 import unittest
+from unittest import mock
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from tests.test_base import BaseTestCase
+from config import Config
+import main
 from main import adjust_timestamps
 
 
@@ -53,6 +56,32 @@ class TestTimestampAdjustment(BaseTestCase):
         text = "This is just regular text\nwith no timestamps\nat all."
         result = adjust_timestamps(text, 30, self.config)
         self.assertEqual(result, text)  # Should be unchanged
+    
+    def test_adjust_timestamps_mixed_formats(self):
+        """Test that each match is read using the groups of the format that matched it."""
+        config = Config(test_mode=True)
+        config.set('timestamp.input_formats', [
+            {"pattern": r'\[(\d{1,2}):(\d{2}):(\d{2})\]', "groups": ["hours", "minutes", "seconds"]},
+            {"pattern": r'<(\d{2}):(\d{2})>', "groups": ["minutes", "seconds"]},
+        ])
+        result = adjust_timestamps("[3:45:20] Speaker\n<12:30> Speaker", 10, config)
+        self.assertEqual(result, "[03:45:30] Speaker\n[00:12:40] Speaker")
+    
+    def test_adjust_timestamps_repeated(self):
+        """Test that repeated timestamps are all adjusted."""
+        text = "[01:00:00] A [01:00:00] B\n[01:00:00] C"
+        result = adjust_timestamps(text, 5, self.config)
+        self.assertEqual(result, "[01:00:05] A [01:00:05] B\n[01:00:05] C")
+    
+    def test_adjust_timestamps_without_regex_parser(self):
+        """Test that adjustment still works when the private regex parser is unavailable."""
+        config = Config(test_mode=True)
+        config.set('timestamp.input_formats', [
+            {"pattern": r'\{(\d{2}):(\d{2})\}', "groups": ["minutes", "seconds"]},
+        ])
+        with mock.patch.object(main, '_sre_parse', None):
+            result = adjust_timestamps("{12:30} Speaker\nNo timestamp", 10, config)
+        self.assertEqual(result, "[00:12:40] Speaker\nNo timestamp")
 
 
 if __name__ == '__main__':
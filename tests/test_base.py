@@ -5,10 +5,23 @@ Base test class with cleanup functionality for test-generated files.
 
 import unittest
 import os
+import re
+import time
 import glob
+import fnmatch
+import tempfile
 from pathlib import Path
+from unittest import mock
+import config
 from config import Config
 
+# Patterns for test-generated files, matched in one pass over the outputs directory
+_TEST_OUTPUT_PATTERN = re.compile('|'.join(fnmatch.translate(pattern) for pattern in (
+    "tmp*",  # Temporary files
+    "*_plus*s.*",  # Files with adjustment patterns
+    "*_minus*s.*",  # Files with adjustment patterns
+)))
+
 
 class BaseTestCase(unittest.TestCase):
     """Base test case with cleanup functionality."""
@@ -20,6 +33,11 @@ class BaseTestCase(unittest.TestCase):
         cls.outputs_dir = cls.project_root / "outputs"
         cls.initial_output_files = set()
         
+        # Keep the JSON copies of parsed config files out of the user's cache directory
+        cls._sidecar_dir = tempfile.TemporaryDirectory()
+        cls._sidecar_patch = mock.patch.object(config, '_SIDECAR_DIR', Path(cls._sidecar_dir.name))
+        cls._sidecar_patch.start()
+        
         # Record files that existed before tests
         if cls.outputs_dir.exists():
             cls.initial_output_files = set(f.name for f in cls.outputs_dir.iterdir() if f.is_file())
@@ -35,12 +53,12 @@ class BaseTestCase(unittest.TestCase):
     def tearDown(self):
         """Clean up individual test - remove any files this test generated."""
         # Clean up any files specifically tracked by this test
+        # (unlinking directly instead of checking existence first saves a stat)
         for file_path in self.test_generated_files:
-            if os.path.exists(file_path):
-                try:
-                    os.unlink(file_path)
-                except (OSError, PermissionError):
-                    pass  # Ignore cleanup errors
+            try:
+                os.unlink(file_path)
+            except OSError:
+                pass  # Missing file or cleanup error
         
         # Clean up any temporary files in outputs directory
         self._cleanup_test_outputs()
@@ -48,6 +66,9 @@ class BaseTestCase(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Clean up test class - remove any remaining test files."""
+        cls._sidecar_patch.stop()
+        cls._sidecar_dir.cleanup()
+        
         if cls.outputs_dir.exists():
             current_files = set(f.name for f in cls.outputs_dir.iterdir() if f.is_file())
             new_files = current_files - cls.initial_output_files
@@ -61,25 +82,24 @@ class BaseTestCase(unittest.TestCase):
     
     def _cleanup_test_outputs(self):
         """Clean up test-generated files in outputs directory."""
-        if not self.outputs_dir.exists():
-            return
+        # Files modified before this (5 minutes ago) are left alone
+        cutoff = time.time() - 300
         
-        # Patterns for test-generated files
-        test_patterns = [
-            "tmp*",  # Temporary files
-            "*_plus*s.*",  # Files with adjustment patterns
-            "*_minus*s.*",  # Files with adjustment patterns
-        ]
-        
-        for pattern in test_patterns:
-            for file_path in self.outputs_dir.glob(pattern):
+        # One directory read; DirEntry caches the file type and stat result
+        try:
+            entries = os.scandir(self.outputs_dir)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.name.startswith('.') or not _TEST_OUTPUT_PATTERN.match(entry.name):
+                    continue
                 # Only clean files that are likely test-generated
-                # Check if file was created recently (within last 5 minutes)
                 try:
-                    stat = file_path.stat()
-                    import time
-                    if time.time() - stat.st_mtime < 300:  # 5 minutes
-                        file_path.unlink()
+                    if not entry.is_file():
+                        continue
+                    if entry.stat().st_mtime > cutoff:
+                        os.unlink(entry.path)
                 except (OSError, PermissionError):
                     pass  # Ignore cleanup errors
     
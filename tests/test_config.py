@@ -6,7 +6,7 @@ Unit tests for configuration management functionality.
 import unittest
 import tempfile
 import os
-from config import Config
+from config import Config, get_config, invalidate
 from test_base import BaseTestCase
 
 
@@ -22,7 +22,7 @@ class TestConfiguration(BaseTestCase):
         """Test default configuration values."""
         # Test default timestamp formats are loaded
         formats = self.config.get_timestamp_formats()
-        self.assertIsInstance(formats, list)
+        self.assertIsInstance(formats, tuple)
         self.assertGreater(len(formats), 0)
         
         # Test that at least one format is enabled by default
@@ -90,6 +90,108 @@ timestamp:
         self.assertEqual(len(formats), 1)
         self.assertEqual(formats[0]['name'], 'enabled_format')
     
+    def test_config_file_change_invalidates_cache(self):
+        """Test that editing a config file is picked up by the next load."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write('files:\n  encoding: "latin-1"\n')
+            temp_config_path = f.name
+        
+        # Register for cleanup
+        self.register_test_file(temp_config_path)
+        
+        config = Config(config_file=temp_config_path, test_mode=True)
+        self.assertEqual(config.get_encoding(), 'latin-1')
+        
+        # Mutating a loaded config must not leak into later loads of the same file
+        config.config_data['files']['encoding'] = 'ascii'
+        config = Config(config_file=temp_config_path, test_mode=True)
+        self.assertEqual(config.get_encoding(), 'latin-1')
+        
+        # Rewrite with a different size so the change is detected regardless of mtime resolution
+        with open(temp_config_path, 'w') as f:
+            f.write('files:\n  encoding: "utf-16"\n')
+        config = Config(config_file=temp_config_path, test_mode=True)
+        self.assertEqual(config.get_encoding(), 'utf-16')
+    
+    def test_restored_config_file_is_reparsed(self):
+        """Test that a config file restored with an older mtime is not served from the parse cache."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write('files:\n  encoding: "latin-1"\n')
+            temp_config_path = f.name
+        
+        # Register for cleanup
+        self.register_test_file(temp_config_path)
+        
+        mtime_ns = os.stat(temp_config_path).st_mtime_ns
+        config = Config(config_file=temp_config_path, test_mode=True)
+        self.assertEqual(config.get_encoding(), 'latin-1')
+        
+        # Same size, older modification time (as after a git checkout or cp -p)
+        with open(temp_config_path, 'w') as f:
+            f.write('files:\n  encoding: "utf-16"\n')
+        os.utime(temp_config_path, ns=(mtime_ns - 10**9, mtime_ns - 10**9))
+        config = Config(config_file=temp_config_path, test_mode=True)
+        self.assertEqual(config.get_encoding(), 'utf-16')
+    
+    def test_set_updates_accessors(self):
+        """Test that set() changes values seen by get() and the accessors."""
+        self.assertEqual(self.config.get('timestamp.output_format'), '[{hours:02d}:{minutes:02d}:{seconds:02d}]')
+        
+        self.config.set('timestamp.output_format', '{hours}h{minutes}m{seconds}s')
+        self.assertEqual(self.config.get('timestamp.output_format'), '{hours}h{minutes}m{seconds}s')
+        self.assertEqual(self.config.get_output_format(), '{hours}h{minutes}m{seconds}s')
+        
+        # Missing keys still honour the default after being looked up once
+        self.assertIsNone(self.config.get('files.missing'))
+        self.assertEqual(self.config.get('files.missing', 'fallback'), 'fallback')
+    
+    def test_config_data_edits_are_seen(self):
+        """Test that editing config_data in place is reflected by get() and the accessors."""
+        self.assertEqual(self.config.get_encoding(), 'utf-8')
+        
+        self.config.config_data['files']['encoding'] = 'latin-1'
+        self.assertEqual(self.config.get('files.encoding'), 'latin-1')
+        self.assertEqual(self.config.get_encoding(), 'latin-1')
+        
+        self.config.config_data['timestamp']['input_formats'] = []
+        self.assertEqual(self.config.get_timestamp_formats(), ())
+    
+    def test_test_mode_defaults_are_not_shared(self):
+        """Test that changing a test-mode config never leaks into other instances."""
+        config = Config(test_mode=True)
+        config.get('timestamp')['output_format'] = '{hours}h'
+        config.set('files.encoding', 'latin-1')
+        config.config_data['files']['output_dir'] = 'elsewhere'
+        
+        fresh = Config(test_mode=True)
+        self.assertEqual(fresh.get_encoding(), 'utf-8')
+        self.assertEqual(fresh.get_output_dir(), 'outputs')
+        self.assertEqual(fresh.get_output_format(), '[{hours:02d}:{minutes:02d}:{seconds:02d}]')
+    
+    def test_get_config_reuses_instance(self):
+        """Test that get_config returns one instance per config file until invalidated."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write('files:\n  encoding: "latin-1"\n')
+            temp_config_path = f.name
+        
+        # Register for cleanup
+        self.register_test_file(temp_config_path)
+        
+        try:
+            config = get_config(temp_config_path)
+            self.assertIs(get_config(temp_config_path), config)
+            
+            invalidate()
+            self.assertIsNot(get_config(temp_config_path), config)
+        finally:
+            invalidate()
+    
+    def test_timestamp_formats_are_read_only(self):
+        """Test that returned formats cannot be mutated by callers."""
+        formats = self.config.get_timestamp_formats()
+        with self.assertRaises(TypeError):
+            formats[0]['enabled'] = False
+    
     def test_environment_variable_override(self):
         """Test that environment variables override config values."""
         # Set environment variable
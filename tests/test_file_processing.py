@@ -1,12 +1,20 @@
 #!/usr/bin/env python3
 """
 Unit tests for file processing functionality.
+
+Set FAST_TESTS=1 to skip the tests that start worker processes.
 """
 
 import unittest
 import tempfile
 import os
-from main import process_file, generate_output_filename
+import io
+import shutil
+import contextlib
+from unittest import mock
+import main
+from main import process_file, process_files, generate_output_filename, adjust_timestamps
+from config import get_config, invalidate
 from test_base import BaseTestCase
 
 
@@ -103,7 +111,208 @@ Just regular text."""
         
         # Verify content is unchanged
         self.assertEqual(output_content.strip(), input_content.strip())
-
+    
+    def test_process_file_in_place(self):
+        """Test processing a file onto itself."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as input_file:
+            input_file.write("[00:01:30] Speaker 1: Hello there.\n[00:02:45] Speaker 2: Hi.\n")
+            input_path = input_file.name
+        
+        # Register file for cleanup
+        self.register_test_file(input_path)
+        
+        self.assertTrue(process_file(input_path, input_path, 30, self.config))
+        
+        with open(input_path, 'r') as f:
+            output_content = f.read()
+        
+        self.assertEqual(output_content, "[00:02:00] Speaker 1: Hello there.\n[00:03:15] Speaker 2: Hi.\n")
+    
+    def test_process_file_with_content(self):
+        """Test that content handed in is adjusted without reading the input again."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as input_file:
+            input_file.write("stale content\n")
+            input_path = input_file.name
+        output_path = input_path + '.out'
+        
+        # Register files for cleanup
+        self.register_test_file(input_path)
+        self.register_test_file(output_path)
+        
+        content = "[00:01:30] Speaker 1: Hello there.\r\n[00:02:45] Speaker 2: Hi.\r\n"
+        self.assertTrue(process_file(input_path, output_path, 30, self.config, content))
+        
+        with open(output_path, 'r', newline='') as f:
+            output_content = f.read()
+        
+        self.assertEqual(output_content, "[00:02:00] Speaker 1: Hello there.\r\n[00:03:15] Speaker 2: Hi.\r\n")
+    
+    def test_process_file_same_output_on_every_path(self):
+        """Test that the bytes path and the text paths match the same timestamps (ASCII digits only)."""
+        content = "[\u0660\u0661:\u0660\u0662:\u0660\u0663] Speaker 1: Hello.\n[00:01:30] Speaker 2: Hi.\n"
+        expected = "[\u0660\u0661:\u0660\u0662:\u0660\u0663] Speaker 1: Hello.\n[00:02:00] Speaker 2: Hi.\n"
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as input_file:
+            input_file.write(content)
+            input_path = input_file.name
+        output_path = input_path + '.out'
+        
+        # Register files for cleanup
+        self.register_test_file(input_path)
+        self.register_test_file(output_path)
+        
+        self.assertEqual(adjust_timestamps(content, 30, self.config), expected)
+        for handed_in in (None, content):
+            with self.subTest(content_handed_in=handed_in is not None):
+                self.assertTrue(process_file(input_path, output_path, 30, self.config, handed_in))
+                with open(output_path, 'r', encoding='utf-8') as f:
+                    self.assertEqual(f.read(), expected)
+    
+    def test_process_file_output_dir_removed(self):
+        """Test that an output directory removed between files is created again."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, 'input.txt')
+            with open(input_path, 'w') as f:
+                f.write("[00:01:30] Speaker 1: Hello there.\n")
+            output_dir = os.path.join(temp_dir, 'adjusted')
+            output_path = os.path.join(output_dir, 'output.txt')
+            
+            self.assertTrue(process_file(input_path, output_path, 30, self.config))
+            shutil.rmtree(output_dir)
+            self.assertTrue(process_file(input_path, output_path, 30, self.config))
+            
+            with open(output_path, 'r') as f:
+                self.assertEqual(f.read(), "[00:02:00] Speaker 1: Hello there.\n")
+    
+    def test_process_file_large_input_uses_mmap(self):
+        """Test processing a file above the mmap threshold."""
+        content = "[00:01:30] Speaker 1: Hello there.\nNo timestamp here.\n[00:02:45] Speaker 2: Hi.\n"
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as input_file:
+            input_file.write(content)
+            input_path = input_file.name
+        output_path = input_path + '.out'
+        
+        # Register files for cleanup
+        self.register_test_file(input_path)
+        self.register_test_file(output_path)
+        
+        with mock.patch.object(main, '_MMAP_THRESHOLD', 1):
+            self.assertTrue(process_file(input_path, output_path, 30, self.config))
+        
+        with open(output_path, 'r') as f:
+            output_content = f.read()
+        
+        self.assertEqual(output_content, "[00:02:00] Speaker 1: Hello there.\nNo timestamp here.\n[00:03:15] Speaker 2: Hi.\n")
+    
+    def test_process_file_large_input_length_change(self):
+        """Test the mmap path when adjusted timestamps are longer than the originals."""
+        self.config.set('timestamp.input_formats', [
+            {"pattern": r'<(\d{2}):(\d{2})>', "groups": ["minutes", "seconds"]},
+        ])
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as input_file:
+            input_file.write("<12:30> Speaker 1: Hello there.\n<13:00> Speaker 2: Hi.\n")
+            input_path = input_file.name
+        output_path = input_path + '.out'
+        
+        # Register files for cleanup
+        self.register_test_file(input_path)
+        self.register_test_file(output_path)
+        
+        with mock.patch.object(main, '_MMAP_THRESHOLD', 1):
+            self.assertTrue(process_file(input_path, output_path, 10, self.config))
+        
+        with open(output_path, 'r') as f:
+            output_content = f.read()
+        
+        self.assertEqual(output_content, "[00:12:40] Speaker 1: Hello there.\n[00:13:10] Speaker 2: Hi.\n")
+    
+    def run_batch(self, input_paths, workers):
+        """
+        Run process_files isolated from the developer's configuration.
+        
+        Returns:
+            Tuple: The results, each input's output path, and what was printed
+        """
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write('files:\n  encoding: "utf-8"\n')
+            config_path = f.name
+        self.register_test_file(config_path)
+        
+        # Set through the environment so that workers inherit it even when they
+        # are spawned rather than forked (the config file replaces any user config)
+        env = {
+            'TIMESTAMP_FORMAT': '[{hours:02d}:{minutes:02d}:{seconds:02d}]',
+            'XDG_CACHE_HOME': self._sidecar_dir.name,
+        }
+        stdout = io.StringIO()
+        with mock.patch.dict(os.environ, env), contextlib.redirect_stdout(stdout):
+            invalidate()
+            try:
+                results = process_files(input_paths, 30, config_file=config_path, workers=workers)
+                config = get_config(config_path)
+                output_paths = [generate_output_filename(path, 30, config) for path in input_paths]
+            finally:
+                invalidate()
+        
+        for output_path in output_paths:
+            self.register_test_file(str(output_path))
+        return results, output_paths, stdout.getvalue()
+    
+    @unittest.skipIf(os.environ.get('FAST_TESTS'), "worker process tests skipped in fast mode")
+    def test_process_files_batch(self):
+        """Test processing several files in worker processes."""
+        input_paths = []
+        for minutes in (1, 2):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as input_file:
+                input_file.write(f"[00:0{minutes}:00] Speaker: Hello.\n")
+                input_paths.append(input_file.name)
+            self.register_test_file(input_file.name)
+        
+        results, output_paths, _ = self.run_batch(input_paths, workers=2)
+        self.assertEqual(results, [True, True])
+        
+        for minutes, output_path in zip((1, 2), output_paths):
+            with open(output_path, 'r') as f:
+                self.assertEqual(f.read(), f"[00:0{minutes}:30] Speaker: Hello.\n")
+    
+    def test_process_files_batch_same_name(self):
+        """Test that batch inputs sharing a file name are not written over each other."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_paths = []
+            for folder in ('a', 'b'):
+                os.mkdir(os.path.join(temp_dir, folder))
+                input_path = os.path.join(temp_dir, folder, 'tmp_same_name.txt')
+                with open(input_path, 'w') as f:
+                    f.write("[00:01:00] Speaker: Hello.\n")
+                input_paths.append(input_path)
+            
+            results, output_paths, output = self.run_batch(input_paths, workers=1)
+        
+        self.assertEqual(results, [False, False])
+        self.assertIn("would all be written to", output)
+        self.assertFalse(output_paths[0].exists())
+    
+    def test_process_file_non_ascii_compatible_encoding(self):
+        """Test processing a file whose encoding requires decoding (UTF-16), keeping CRLF line endings."""
+        self.config.set('files.encoding', 'utf-16')
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-16', newline='') as input_file:
+            input_file.write("Café [00:01:30] Speaker 1: Hello there.\r\n")
+            input_path = input_file.name
+        output_path = input_path + '.out'
+        
+        # Register files for cleanup
+        self.register_test_file(input_path)
+        self.register_test_file(output_path)
+        
+        # Both the whole-file path and the line-by-line path for large files
+        for threshold in (main._MMAP_THRESHOLD, 1):
+            with self.subTest(threshold=threshold), mock.patch.object(main, '_MMAP_THRESHOLD', threshold):
+                self.assertTrue(process_file(input_path, output_path, 30, self.config))
+                
+                with open(output_path, 'r', encoding='utf-16', newline='') as f:
+                    output_content = f.read()
+                
+                self.assertEqual(output_content, "Café [00:02:00] Speaker 1: Hello there.\r\n")
 
 if __name__ == '__main__':
     unittest.main()
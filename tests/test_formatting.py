@@ -33,6 +33,12 @@ class TestTimestampFormatting(unittest.TestCase):
         seconds = 7323  # 2 hours, 2 minutes, 3 seconds
         result = seconds_to_timestamp(seconds, "{hours:02d}:{minutes:02d}:{seconds:02d}")
         self.assertEqual(result, "02:02:03")
+    
+    def test_format_hours_above_two_digits(self):
+        """Test formatting a timestamp of 100 hours or more."""
+        seconds = 100 * 3600 + 5  # 100 hours, 0 minutes, 5 seconds
+        result = seconds_to_timestamp(seconds, "[{hours:02d}:{minutes:02d}:{seconds:02d}]")
+        self.assertEqual(result, "[100:00:05]")
 
 
 if __name__ == '__main__':
@@ -6,111 +6,116 @@ Integration tests for the timestamp adjuster application.
 import unittest
 import tempfile
 import os
-import subprocess
-import sys
+import io
+import re
+import contextlib
+from pathlib import Path
+from unittest import mock
+from main import main, generate_output_filename
+from config import invalidate
 from test_base import BaseTestCase
 
+# Output timestamps in the format the tests request through TIMESTAMP_FORMAT
+_TIMESTAMP_PATTERN = re.compile(r'\[\d{2}:\d{2}:\d{2}\]')
+
 
 class TestIntegration(BaseTestCase):
     """Test full application integration."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        super().setUp()  # Call base class setUp
+    @classmethod
+    def setUpClass(cls):
+        """Set up the input file shared by all tests (none of them modify it)."""
+        super().setUpClass()  # Call base class setUpClass
         
         # Create temporary input file
-        self.input_content = """Transcript starts here.
+        cls.input_content = """Transcript starts here.
 [00:01:30] Alice: Hello everyone.
 [00:02:45] Bob: How is everyone doing?
 [00:03:15] Alice: Great, thanks for asking!
 [00:04:00] Charlie: What's on the agenda today?
 End of transcript."""
         
-        self.input_file = tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False)
-        self.input_file.write(self.input_content)
-        self.input_file.close()
-        self.register_test_file(self.input_file.name)
+        # One temporary directory holds every file the tests create outside outputs/
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.input_path = os.path.join(cls.temp_dir.name, 'tmp_integration_input.txt')
+        with open(cls.input_path, 'w') as f:
+            f.write(cls.input_content)
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        super().tearDown()  # Call base class tearDown
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared temporary directory."""
+        cls.temp_dir.cleanup()
+        super().tearDownClass()  # Call base class tearDownClass
     
-    def test_full_application_run(self):
-        """Test running the full application end-to-end."""
-        # Run the application
-        output_file = tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False)
-        output_file.close()
-        self.register_test_file(output_file.name)
-        
-        # Run main.py with test arguments
+    def run_main(self, *argv):
+        """Run main() in-process with the given arguments and return what it printed."""
         # Set environment variable to override user config for predictable test results
-        env = os.environ.copy()
-        env['TIMESTAMP_FORMAT'] = '[{hours:02d}:{minutes:02d}:{seconds:02d}]'
-        
-        result = subprocess.run([
-            sys.executable, 'main.py',
-            self.input_file.name,
-            '30',
-            '--output', output_file.name
-        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)) + '/..', env=env)
-        
-        # Check that the command succeeded
-        self.assertEqual(result.returncode, 0, f"Application failed with error: {result.stderr}")
+        env = {'TIMESTAMP_FORMAT': '[{hours:02d}:{minutes:02d}:{seconds:02d}]'}
+        stdout = io.StringIO()
+        with mock.patch.dict(os.environ, env), contextlib.redirect_stdout(stdout):
+            invalidate()  # Load the configuration with the environment above
+            try:
+                main(list(argv))
+            finally:
+                invalidate()
+        return stdout.getvalue()
+    
+    def test_application_variants(self):
+        """Test running the full application end-to-end, with explicit and auto-generated output."""
+        explicit_output_path = os.path.join(self.temp_dir.name, 'output.txt')
         
-        # Read the output file
-        with open(output_file.name, 'r') as f:
-            output_content = f.read()
+        # The auto-generated output goes to the outputs folder
+        auto_output_path = generate_output_filename(self.input_path, 60, self.get_test_config())
+        self.assertEqual(auto_output_path.name, f"{Path(self.input_path).stem}_plus60s.txt")
+        self.register_test_file(auto_output_path)
         
-        # Verify timestamps were adjusted correctly
-        self.assertIn("[00:02:00]", output_content)  # 00:01:30 + 30s
-        self.assertIn("[00:03:15]", output_content)  # 00:02:45 + 30s
-        self.assertIn("[00:03:45]", output_content)  # 00:03:15 + 30s
-        self.assertIn("[00:04:30]", output_content)  # 00:04:00 + 30s
+        variants = [
+            # (adjustment, extra arguments, output path, expected timestamps)
+            (30, ['--output', explicit_output_path], explicit_output_path, [
+                "[00:02:00]",  # 00:01:30 + 30s
+                "[00:03:15]",  # 00:02:45 + 30s
+                "[00:03:45]",  # 00:03:15 + 30s
+                "[00:04:30]",  # 00:04:00 + 30s
+            ]),
+            (60, [], auto_output_path, [
+                "[00:02:30]",  # 00:01:30 + 60s
+                "[00:03:45]",  # 00:02:45 + 60s
+                "[00:04:15]",  # 00:03:15 + 60s
+                "[00:05:00]",  # 00:04:00 + 60s
+            ]),
+        ]
         
-        # Verify non-timestamp content is preserved
-        self.assertIn("Transcript starts here.", output_content)
-        self.assertIn("Alice: Hello everyone.", output_content)
-        self.assertIn("End of transcript.", output_content)
-    
-    def test_application_with_auto_output(self):
-        """Test application with automatic output filename generation."""
-        project_root = os.path.dirname(os.path.abspath(__file__)) + '/..'
-        
-        try:
-            # Run main.py without output file (should auto-generate)
-            # Set environment variable to override user config for predictable test results
-            env = os.environ.copy()
-            env['TIMESTAMP_FORMAT'] = '[{hours:02d}:{minutes:02d}:{seconds:02d}]'
-            
-            result = subprocess.run([
-                sys.executable, 'main.py',
-                self.input_file.name,
-                '60'
-            ], capture_output=True, text=True, cwd=project_root, env=env)
-            
-            # Check that the command succeeded
-            self.assertEqual(result.returncode, 0, f"Application failed with error: {result.stderr}")
-            
-            # The output file should be auto-generated
-            input_basename = os.path.splitext(os.path.basename(self.input_file.name))[0]
-            expected_output = f"outputs/{input_basename}_plus60s.txt"
-            
-            # Check if the output file was created (relative to project root)
-            output_path = os.path.join(project_root, expected_output)
-            
-            if os.path.exists(output_path):
-                # Register for cleanup
-                self.register_test_file(output_path)
+        for adjustment, extra_args, output_path, expected_timestamps in variants:
+            with self.subTest(adjustment=adjustment):
+                # Run main() with test arguments
+                output = self.run_main(self.input_path, str(adjustment), *extra_args)
+                self.assertIn(f"Successfully adjusted timestamps by {adjustment} seconds.", output)
                 
-                # Read and verify the output
+                # Read the output file
                 with open(output_path, 'r') as f:
                     output_content = f.read()
                 
-                # Verify timestamps were adjusted correctly
-                self.assertIn("[00:02:30]", output_content)  # 00:01:30 + 60s
-                self.assertIn("[00:03:45]", output_content)  # 00:02:45 + 60s
-        except Exception as e:
-            self.skipTest(f"Integration test skipped due to file system constraints: {e}")
+                # Verify every timestamp was adjusted, in order (one scan collects them all)
+                self.assertEqual(_TIMESTAMP_PATTERN.findall(output_content), expected_timestamps)
+                
+                # Verify non-timestamp content is preserved
+                self.assertIn("Transcript starts here.", output_content)
+                self.assertIn("Alice: Hello everyone.", output_content)
+                self.assertIn("End of transcript.", output_content)
+    
+    def test_zero_adjustment_applies_output_format(self):
+        """Test that a zero adjustment still renders timestamps in the requested output format."""
+        output_path = os.path.join(self.temp_dir.name, 'output_zero.txt')
+        output = self.run_main(self.input_path, '0', '--output', output_path,
+                               '--format', '{hours:02d}h{minutes:02d}m{seconds:02d}s')
+        self.assertIn("Successfully adjusted timestamps by 0 seconds.", output)
+        
+        with open(output_path, 'r') as f:
+            output_content = f.read()
+        
+        self.assertIn("00h01m30s Alice: Hello everyone.", output_content)
+        self.assertIn("00h04m00s Charlie:", output_content)
+        self.assertEqual(_TIMESTAMP_PATTERN.findall(output_content), [])
 
 
 if __name__ == '__main__':
@@ -10,9 +10,10 @@ from main import parse_timestamp
 class TestTimestampParsing(unittest.TestCase):
     """Test timestamp parsing functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.formats = [
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests (none of them modify the formats)."""
+        cls.formats = [
             {
                 "pattern": r'\[(\d{2}):(\d{2}):(\d{2})\]',
                 "name": "bracketed_hms",
@@ -33,28 +34,31 @@ class TestTimestampParsing(unittest.TestCase):
             }
         ]
     
-    def test_parse_bracketed_timestamp(self):
-        """Test parsing [HH:MM:SS] format."""
-        result = parse_timestamp("[01:30:45]", self.formats)
-        expected = 1 * 3600 + 30 * 60 + 45  # 5445 seconds
-        self.assertEqual(result, expected)
-    
-    def test_parse_simple_timestamp(self):
-        """Test parsing HH:MM:SS format."""
-        result = parse_timestamp("02:15:30", self.formats)
-        expected = 2 * 3600 + 15 * 60 + 30  # 8130 seconds
-        self.assertEqual(result, expected)
-    
-    def test_parse_flexible_timestamp(self):
-        """Test parsing [H:MM:SS] format."""
-        result = parse_timestamp("[3:45:20]", self.formats)
-        expected = 3 * 3600 + 45 * 60 + 20  # 13520 seconds
-        self.assertEqual(result, expected)
+    def test_parse_cases(self):
+        """Test parsing each supported format, and rejecting invalid input."""
+        cases = [
+            ("[01:30:45]", 1 * 3600 + 30 * 60 + 45),  # [HH:MM:SS], 5445 seconds
+            ("02:15:30", 2 * 3600 + 15 * 60 + 30),    # HH:MM:SS, 8130 seconds
+            ("[3:45:20]", 3 * 3600 + 45 * 60 + 20),   # [H:MM:SS], 13520 seconds
+            ("invalid", None),
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(parse_timestamp(text, self.formats), expected)
     
-    def test_parse_invalid_timestamp(self):
-        """Test parsing invalid timestamp format."""
-        result = parse_timestamp("invalid", self.formats)
-        self.assertIsNone(result)
+    def test_parse_with_inline_flags(self):
+        """Test that formats with leading inline flags are still parsed."""
+        formats = [
+            {
+                "pattern": r'(?i)t(\d{2}):(\d{2}):(\d{2})',
+                "name": "prefixed_hms",
+                "groups": ["hours", "minutes", "seconds"],
+                "enabled": True
+            },
+            *self.formats
+        ]
+        self.assertEqual(parse_timestamp("T01:02:03", formats), 3723)
+        self.assertEqual(parse_timestamp("[00:01:02]", formats), 62)
     
     def test_parse_with_disabled_format(self):
         """Test that disabled formats are not parsed."""
@@ -68,6 +72,15 @@ class TestTimestampParsing(unittest.TestCase):
         ]
         result = parse_timestamp("[01:30:45]", disabled_formats)
         self.assertIsNone(result)
+    
+    def test_parse_sees_edits_to_tuple_of_dicts(self):
+        """Test that editing a format inside a caller's tuple takes effect on the next parse."""
+        formats = tuple(dict(fmt) for fmt in self.formats)
+        self.assertEqual(parse_timestamp("[01:30:45]", formats), 5445)
+        
+        for fmt in formats:
+            fmt["enabled"] = False
+        self.assertIsNone(parse_timestamp("[01:30:45]", formats))
 
 
 if __name__ == '__main__':